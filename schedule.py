@@ -5,11 +5,26 @@
 # Assumes Python 3.0 or higher
 
 import argparse
-from datetime import datetime, timedelta
+import functools
+import sys
+from datetime import timedelta
 import unittest
 import re
 
+# Precompiled patterns used by normalize_time_input
+_HOUR_ONLY_12 = re.compile(r'^\d{1,2}(am|pm)$')
+_HOUR_MIN_AMPM = re.compile(r'(\d{1,2}:\d{2})(am|pm)')
+_HOUR_ONLY_24 = re.compile(r'^\d{1,2}$')
+
+# Precompiled pattern used by parse_slot_length
+_SLOT_RE = re.compile(r'(?:(\d+)h)?(?:(\d+)m)?')
+
+# Precompiled patterns used by parse_time
+_TIME_12 = re.compile(r'^(\d{1,2}):(\d{1,2})\s+(AM|PM)$')
+_TIME_24 = re.compile(r'^(\d{1,2}):(\d{1,2})$')
+
 # Helper function to parse slot length
+@functools.lru_cache(maxsize=256)
 def parse_slot_length(slot_length):
     """
     Parses a slot length string into a timedelta object.
@@ -28,55 +43,73 @@ def parse_slot_length(slot_length):
         if not slot_length or slot_length.strip() == "":
             raise ValueError("Slot length cannot be empty or whitespace only.")
         
-        hours = 0
-        minutes = 0
-        if 'h' in slot_length:
-            parts = slot_length.split('h')
-            if len(parts) != 2 or not parts[0].isdigit():
-                raise ValueError("Invalid hours format in slot length. Expected format is [hours]h[minutes]m, e.g., '1h15m'.")
-            hours = int(parts[0])
-            remaining = parts[1]
-            if 'm' in remaining:
-                if remaining.count('m') > 1 or not remaining.replace('m', '').isdigit():
-                    raise ValueError("Invalid minutes format in slot length. Expected format is [hours]h[minutes]m, e.g., '1h15m'.")
-                minutes = int(remaining.replace('m', ''))
-            elif remaining:
-                raise ValueError("Invalid format after hours in slot length. Expected format is [hours]h[minutes]m, e.g., '1h15m'.")
-        elif 'm' in slot_length:
-            if slot_length.count('m') > 1 or not slot_length.replace('m', '').isdigit():
-                raise ValueError("Invalid minutes format in slot length. Expected format is [minutes]m, e.g., '15m'.")
-            minutes = int(slot_length.replace('m', ''))
+        if slot_length.isdigit():
+            hours = 0
+            minutes = int(slot_length)
         else:
-            if not slot_length.isdigit():
+            match = _SLOT_RE.fullmatch(slot_length)
+            if not match or not (match.group(1) or match.group(2)):
+                # Work out which part is malformed to report a specific error
+                if 'h' in slot_length:
+                    hours_part, _, remaining = slot_length.partition('h')
+                    if 'h' in remaining or not hours_part.isdigit():
+                        raise ValueError("Invalid hours format in slot length. Expected format is [hours]h[minutes]m, e.g., '1h15m'.")
+                    if 'm' in remaining:
+                        raise ValueError("Invalid minutes format in slot length. Expected format is [hours]h[minutes]m, e.g., '1h15m'.")
+                    raise ValueError("Invalid format after hours in slot length. Expected format is [hours]h[minutes]m, e.g., '1h15m'.")
+                if 'm' in slot_length:
+                    raise ValueError("Invalid minutes format in slot length. Expected format is [minutes]m, e.g., '15m'.")
                 raise ValueError("Invalid slot length format. Must be a number or include 'h'/'m'.")
-            minutes = int(slot_length)
+            hours = int(match.group(1) or 0)
+            minutes = int(match.group(2) or 0)
+        
+        if hours == 0 and minutes == 0:
+            raise ValueError("Slot length must be at least one minute.")
         
         return timedelta(hours=hours, minutes=minutes)
     except ValueError as e:
         raise ValueError(f"Error parsing slot length '{slot_length}': {e}")
 
-# Helper function to format time
-def format_time(dt, format_12, show_ampm):
+# Helper functions to format minutes since midnight, one per output format
+def _format_12_ampm(total_minutes):
+    hours = total_minutes // 60
+    minutes = total_minutes % 60
+    return f"{hours % 12 or 12:02d}:{minutes:02d} {'AM' if hours < 12 else 'PM'}"
+
+def _format_12(total_minutes):
+    hours = total_minutes // 60
+    minutes = total_minutes % 60
+    return f"{hours % 12 or 12:02d}:{minutes:02d}"
+
+def _format_24(total_minutes):
+    hours = total_minutes // 60
+    minutes = total_minutes % 60
+    return f"{hours:02d}:{minutes:02d}"
+
+# Dispatch table keyed by (format_12, show_ampm)
+_MINUTE_FORMATTERS = {
+    (True, True): _format_12_ampm,
+    (True, False): _format_12,
+    (False, True): _format_24,
+    (False, False): _format_24,
+}
+
+# Helper function to select a minutes formatter
+def get_minutes_formatter(format_12, show_ampm):
     """
-    Formats a datetime object into a string representation based on 12-hour or 24-hour format.
+    Selects the function that formats minutes since midnight for the given output format.
 
     Args:
-        dt (datetime): The datetime object to format.
         format_12 (bool): Whether to use 12-hour clock format.
         show_ampm (bool): Whether to show AM/PM labels (applicable for 12-hour format).
 
     Returns:
-        str: The formatted time string.
+        callable: A function taking minutes since midnight and returning the formatted time string.
     """
-    if format_12:
-        if show_ampm:
-            return dt.strftime("%I:%M %p")  # Include AM/PM
-        else:
-            return dt.strftime("%I:%M")     # Exclude AM/PM
-    else:
-        return dt.strftime("%H:%M")
+    return _MINUTE_FORMATTERS[bool(format_12), bool(show_ampm)]
 
 # Function to normalize time input
+@functools.lru_cache(maxsize=256)
 def normalize_time_input(time_str, is_start_time, format_12):
     """
     Normalizes a time input string to ensure consistent format, applying default assumptions for AM/PM.
@@ -101,52 +134,105 @@ def normalize_time_input(time_str, is_start_time, format_12):
                 time_str += ' pm'
         
         # Add :00 if only hours are provided
-        if re.match(r'^\d{1,2}(am|pm)$', time_str):
+        if _HOUR_ONLY_12.match(time_str):
             time_str = time_str[:-2] + ':00 ' + time_str[-2:]
         
         # Ensure there is a space between the time and AM/PM
-        time_str = re.sub(r'(\d{1,2}:\d{2})(am|pm)', r'\1 \2', time_str)
+        time_str = _HOUR_MIN_AMPM.sub(r'\1 \2', time_str)
         
         # Capitalize AM/PM
         time_str = time_str.replace('am', 'AM').replace('pm', 'PM')
     else:
         # Add :00 if only hours are provided for 24-hour format
-        if re.match(r'^\d{1,2}$', time_str):
+        if _HOUR_ONLY_24.match(time_str):
             time_str += ':00'
     
     return time_str
 
-# Main function to generate the schedule
-def generate_schedule(start_time, slot_length, end_time, format_12, condensed_output, show_ampm):
+# Helper function to parse a normalized time
+def parse_time(time_str, format_12):
     """
-    Generates a schedule of time slots based on the given start time, slot length, and end time.
+    Parses a normalized time string into minutes since midnight without going through strptime.
+
+    Args:
+        time_str (str): The normalized time string (e.g., '09:00 AM' or '17:30').
+        format_12 (bool): Whether the time string is in 12-hour format.
+
+    Returns:
+        int: The parsed time as minutes since midnight.
+
+    Raises:
+        ValueError: If the time string is improperly formatted or out of range.
+    """
+    match = (_TIME_12 if format_12 else _TIME_24).match(time_str)
+    if not match:
+        raise ValueError(f"Time '{time_str}' does not match the expected format.")
+
+    hours = int(match.group(1))
+    minutes = int(match.group(2))
+    if minutes > 59:
+        raise ValueError(f"Invalid minutes in time '{time_str}'.")
+
+    if format_12:
+        if not 1 <= hours <= 12:
+            raise ValueError(f"Invalid hours in time '{time_str}'.")
+        if match.group(3) == 'PM':
+            if hours != 12:
+                hours += 12
+        elif hours == 12:
+            hours = 0
+    elif hours > 23:
+        raise ValueError(f"Invalid hours in time '{time_str}'.")
+
+    return hours * 60 + minutes
+
+# Helper function to compute slot boundaries
+def slot_bounds(start_min, end_min, slot_min):
+    """
+    Computes the boundaries of all whole slots that fit between a start and end time.
+
+    Args:
+        start_min (int): The starting time as minutes since midnight.
+        end_min (int): The ending time as minutes since midnight.
+        slot_min (int): The slot length in minutes.
+
+    Returns:
+        range: The boundary times in minutes since midnight; slot i spans bounds i and i + 1.
+    """
+    slot_count = (end_min - start_min) // slot_min
+    return range(start_min, start_min + slot_count * slot_min + 1, slot_min)
+
+# Message returned when the inputs do not allow for a single slot
+NO_SLOTS_MESSAGE = "No slots could be generated. Please check your start time, end time, and slot length to ensure they allow for at least one time slot."
+
+# Function to parse and validate the schedule inputs
+def parse_schedule_bounds(start_time, slot_length, end_time, format_12):
+    """
+    Parses and validates the schedule inputs into whole minutes.
 
     Args:
         start_time (str): The starting time in HH:MM format, with optional AM/PM for 12-hour format.
         slot_length (str): The length of each time slot in format [hours]h[minutes]m.
         end_time (str): The ending time in HH:MM format, with optional AM/PM for 12-hour format.
         format_12 (bool): Whether to use 12-hour clock format.
-        condensed_output (bool): Whether to use condensed output format (e.g., '09:00-10:00').
-        show_ampm (bool): Whether to show AM/PM labels in the output (applicable for 12-hour format).
 
     Returns:
-        list: A list of formatted time slots or an explanatory message if no slots could be generated.
+        tuple: The start time and end time as minutes since midnight, and the slot length in minutes.
+
+    Raises:
+        ValueError: If any input is improperly formatted or the end time is not after the start time.
     """
     try:
         start_time = normalize_time_input(start_time, is_start_time=True, format_12=format_12)
         end_time = normalize_time_input(end_time, is_start_time=False, format_12=format_12)
         
-        if format_12:
-            start = datetime.strptime(start_time, "%I:%M %p")
-            end = datetime.strptime(end_time, "%I:%M %p")
-        else:
-            start = datetime.strptime(start_time, "%H:%M")
-            end = datetime.strptime(end_time, "%H:%M")
+        start_min = parse_time(start_time, format_12)
+        end_min = parse_time(end_time, format_12)
     except ValueError:
         raise ValueError(f"Error parsing start time '{start_time}' or end time '{end_time}'. Please use HH:MM format, and include AM/PM for 12-hour format.")
     
     # Check if end time is after start time
-    if end <= start:
+    if end_min <= start_min:
         raise ValueError(f"End time '{end_time}' must be after start time '{start_time}'.")
     
     try:
@@ -154,23 +240,61 @@ def generate_schedule(start_time, slot_length, end_time, format_12, condensed_ou
     except ValueError as e:
         raise ValueError(f"Invalid slot length '{slot_length}': {e}")
     
-    current_time = start
-    schedule = []
-    
-    # Iterate to generate times until as close as possible to the end time
-    while current_time + slot_delta <= end:
-        end_slot_time = current_time + slot_delta
-        if condensed_output:
-            schedule.append(f"{format_time(current_time, format_12, show_ampm)}-{format_time(end_slot_time, format_12, show_ampm)}")
-        else:
-            schedule.append(f"{format_time(current_time, format_12, show_ampm)} - {format_time(end_slot_time, format_12, show_ampm)}")
-        current_time = end_slot_time
+    # Work in whole minutes so no datetime or timedelta objects reach the slot loop
+    slot_min = slot_delta.days * 1440 + slot_delta.seconds // 60
+    return start_min, end_min, slot_min
+
+# Function to build a slot generator specialized for one output format
+def _make_generator(format_12, condensed_output, show_ampm):
+    """
+    Builds a slot generator with the output format options already resolved.
+
+    Args:
+        format_12 (bool): Whether to use 12-hour clock format.
+        condensed_output (bool): Whether to use condensed output format (e.g., '09:00-10:00').
+        show_ampm (bool): Whether to show AM/PM labels in the output (applicable for 12-hour format).
+
+    Returns:
+        callable: A generator function taking start_min, end_min, and slot_min that yields formatted time slots.
+    """
+    fmt = get_minutes_formatter(format_12, show_ampm)
+    separator = "-" if condensed_output else " - "
+
+    def generate(start_min, end_min, slot_min):
+        # The end of one slot is the start of the next, so each bound is formatted only once
+        bounds = iter(slot_bounds(start_min, end_min, slot_min))
+        cur_str = fmt(next(bounds))
+        for t in bounds:
+            end_str = fmt(t)
+            yield cur_str + separator + end_str
+            cur_str = end_str
+
+    return generate
+
+# Main function to generate the schedule
+def generate_schedule(start_time, slot_length, end_time, format_12, condensed_output, show_ampm):
+    """
+    Generates a schedule of time slots based on the given start time, slot length, and end time.
+
+    Args:
+        start_time (str): The starting time in HH:MM format, with optional AM/PM for 12-hour format.
+        slot_length (str): The length of each time slot in format [hours]h[minutes]m.
+        end_time (str): The ending time in HH:MM format, with optional AM/PM for 12-hour format.
+        format_12 (bool): Whether to use 12-hour clock format.
+        condensed_output (bool): Whether to use condensed output format (e.g., '09:00-10:00').
+        show_ampm (bool): Whether to show AM/PM labels in the output (applicable for 12-hour format).
+
+    Returns:
+        list: A list of formatted time slots or an explanatory message if no slots could be generated.
+    """
+    start_min, end_min, slot_min = parse_schedule_bounds(start_time, slot_length, end_time, format_12)
     
-    # If no slots are generated, provide a meaningful message
-    if not schedule:
-        return ["No slots could be generated. Please check your start time, end time, and slot length to ensure they allow for at least one time slot."]
+    # If no slots can be generated, provide a meaningful message
+    if end_min - start_min < slot_min:
+        return [NO_SLOTS_MESSAGE]
     
-    return schedule
+    generate = _make_generator(format_12, condensed_output, show_ampm)
+    return list(generate(start_min, end_min, slot_min))
 
 # Command line argument processing function
 def process_command_line_arguments():
@@ -225,16 +349,24 @@ def main():
     slot_length = args.SlotLength
     end_time = args.EndingTime
 
-    # Generate the schedule
+    # Resolve the output format once for the whole run
+    generate = _make_generator(format_12, condensed_output, show_ampm)
+
+    # Validate the inputs up front, so errors are reported before any output
     try:
-        schedule = generate_schedule(start_time, slot_length, end_time, format_12, condensed_output, show_ampm)
+        start_min, end_min, slot_min = parse_schedule_bounds(start_time, slot_length, end_time, format_12)
     except ValueError as e:
         print(f"Error: {e}")
         return
 
-    # Output the schedule
-    for slot in schedule:
-        print(slot)
+    # If no slots can be generated, provide a meaningful message
+    if end_min - start_min < slot_min:
+        schedule = [NO_SLOTS_MESSAGE]
+    else:
+        schedule = generate(start_min, end_min, slot_min)
+
+    # Output the schedule in a single write
+    sys.stdout.write("\n".join(schedule) + "\n")
 
 # Unit Tests
 class TestScheduleScript(unittest.TestCase):
@@ -262,9 +394,38 @@ class TestScheduleScript(unittest.TestCase):
         expected = ["09:00-10:00", "10:00-11:00", "11:00-12:00"]
         self.assertEqual(schedule, expected)
 
+    def test_generate_schedule_no_slots(self):
+        schedule = generate_schedule("09:00", "45m", "09:30", format_12=False, condensed_output=True, show_ampm=False)
+        self.assertEqual(schedule, [NO_SLOTS_MESSAGE])
+
+    def test_parse_time(self):
+        self.assertEqual(parse_time("09:15", format_12=False), 9 * 60 + 15)
+        self.assertEqual(parse_time("12:00 AM", format_12=True), 0)
+        self.assertEqual(parse_time("5:30 PM", format_12=True), 17 * 60 + 30)
+        self.assertEqual(parse_time("9:00  AM", format_12=True), 9 * 60)
+        with self.assertRaises(ValueError):
+            parse_time("13:00 PM", format_12=True)
+        with self.assertRaises(ValueError):
+            parse_time("9:60", format_12=False)
+
+    def test_slot_bounds(self):
+        self.assertEqual(list(slot_bounds(540, 600, 25)), [540, 565, 590])
+        self.assertEqual(list(slot_bounds(540, 560, 25)), [540])
+
     def test_invalid_slot_length(self):
         with self.assertRaises(ValueError):
             parse_slot_length("invalid")
+        with self.assertRaises(ValueError):
+            parse_slot_length("0m")
+        with self.assertRaisesRegex(ValueError, "Invalid format after hours"):
+            parse_slot_length("1h15")
+        with self.assertRaisesRegex(ValueError, "Invalid minutes format"):
+            parse_slot_length("m")
+
+    def test_get_minutes_formatter(self):
+        self.assertEqual(get_minutes_formatter(format_12=True, show_ampm=True)(0), "12:00 AM")
+        self.assertEqual(get_minutes_formatter(format_12=True, show_ampm=False)(12 * 60 + 5), "12:05")
+        self.assertEqual(get_minutes_formatter(format_12=False, show_ampm=False)(17 * 60 + 30), "17:30")
 
     def test_invalid_start_time_format(self):
         with self.assertRaises(ValueError):